@@ -7,6 +7,7 @@ This is the starting point of our application.
 Run this file to start the Restaurant Menu System.
 """
 
+import logging
 import sys
 from pathlib import Path
 
@@ -15,6 +16,9 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 def main():
     """Main function - entry point of the application"""
+    # Only warnings and errors from the managers reach the screen
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
     try:
         # Import and run the complete menu application
         from restaurant_menu.menu_app import MenuManagementApp
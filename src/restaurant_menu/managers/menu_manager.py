@@ -3,16 +3,183 @@ Menu Manager for Restaurant Menu System
 Handles all menu item CRUD operations (Create, Read, Update, Delete)
 """
 
+import logging
 import sqlite3
-from typing import List, Tuple, Optional, Dict
+import time
+from typing import Iterable, Iterator, List, Tuple, Optional, Dict, Union
+
+from ..models.database import FETCH_BATCH_SIZE, page_params
+from ..models.records import MenuItem
+
+logger = logging.getLogger(__name__)
+
+# SQL is kept in module-level constants so every call passes the same
+# string object and sqlite3's per-connection statement cache can reuse
+# the prepared statement instead of re-parsing it
+
+SQL_INSERT_ITEM = '''
+    INSERT INTO menu_items (name, description, price, category_id,
+                          preparation_time, ingredients, allergens, calories)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# No join: category names come from MenuManager's category cache, and
+# sorting on the integer category_id is cheaper than on the name
+SQL_GET_ALL_ITEMS = '''
+    SELECT item_id, name, description, price, category_id,
+           is_available, preparation_time, ingredients, allergens, calories
+    FROM menu_items
+    ORDER BY category_id, name
+    LIMIT ? OFFSET ?
+'''
+
+SQL_GET_BY_CATEGORY = '''
+    SELECT item_id, name, description, price, category_id,
+           is_available, preparation_time, ingredients, allergens, calories
+    FROM menu_items
+    WHERE category_id = ? AND is_available = 1
+    ORDER BY name
+    LIMIT ? OFFSET ?
+'''
+
+SQL_SEARCH_FTS = '''
+    SELECT m.item_id, m.name, m.description, m.price, c.name as category,
+           m.is_available, m.preparation_time, m.ingredients, m.allergens, m.calories
+    FROM menu_items_fts
+    JOIN menu_items m ON m.item_id = menu_items_fts.rowid
+    LEFT JOIN categories c ON m.category_id = c.category_id
+    WHERE menu_items_fts MATCH ? AND m.is_available = 1
+    ORDER BY m.name
+    LIMIT ? OFFSET ?
+'''
+
+# Fallback for SQLite builds without FTS5
+SQL_SEARCH_LIKE = '''
+    SELECT m.item_id, m.name, m.description, m.price, c.name as category,
+           m.is_available, m.preparation_time, m.ingredients, m.allergens, m.calories
+    FROM menu_items m
+    LEFT JOIN categories c ON m.category_id = c.category_id
+    WHERE (m.name LIKE ? ESCAPE '\\' OR m.description LIKE ? ESCAPE '\\')
+      AND m.is_available = 1
+    ORDER BY m.name
+    LIMIT ? OFFSET ?
+'''
+
+# Primary-key lookup only; the category name is filled in from a cached map
+SQL_GET_ITEM_BY_ID = '''
+    SELECT item_id, name, description, price, category_id,
+           is_available, preparation_time, ingredients, allergens, calories
+    FROM menu_items
+    WHERE item_id = ?
+'''
+
+# Names starting with a term; a range scan on idx_menu_items_name
+# (the unary + keeps the planner from picking the is_available index instead)
+SQL_SEARCH_PREFIX = '''
+    SELECT m.item_id, m.name, m.description, m.price, c.name as category,
+           m.is_available, m.preparation_time, m.ingredients, m.allergens, m.calories
+    FROM menu_items m
+    LEFT JOIN categories c ON m.category_id = c.category_id
+    WHERE m.name LIKE ? ESCAPE '\\' AND +m.is_available = 1
+    ORDER BY m.name COLLATE NOCASE
+    LIMIT ? OFFSET ?
+'''
+
+# Columns update_menu_item may change, in the order SQL_UPDATE_ITEM binds them
+UPDATABLE_ITEM_FIELDS = (
+    'name', 'description', 'price', 'category_id', 'preparation_time',
+    'ingredients', 'allergens', 'calories', 'is_available',
+)
+
+# One statement for every update: a NULL parameter keeps the current value
+SQL_UPDATE_ITEM = '''
+    UPDATE menu_items
+    SET name = COALESCE(?, name),
+        description = COALESCE(?, description),
+        price = COALESCE(?, price),
+        category_id = COALESCE(?, category_id),
+        preparation_time = COALESCE(?, preparation_time),
+        ingredients = COALESCE(?, ingredients),
+        allergens = COALESCE(?, allergens),
+        calories = COALESCE(?, calories),
+        is_available = COALESCE(?, is_available),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE item_id = ?
+'''
+
+SQL_DELETE_ITEM = "DELETE FROM menu_items WHERE item_id = ?"
+
+SQL_ADD_CATEGORY = '''
+    INSERT INTO categories (name, description)
+    VALUES (?, ?)
+'''
+
+SQL_ALL_CATEGORIES = '''
+    SELECT category_id, name, description, is_active
+    FROM categories
+    ORDER BY name
+'''
+
+# Item count and last change time; changes whenever items are added,
+# removed or updated
+SQL_ITEMS_VERSION = '''
+    SELECT COUNT(*), MAX(updated_at) FROM menu_items
+'''
+
+SQL_CATEGORY_ITEMS_VERSION = '''
+    SELECT COUNT(*), MAX(updated_at) FROM menu_items
+    WHERE category_id = ? AND is_available = 1
+'''
+
+# Item counts and average price in a single pass over menu_items
+SQL_STATS_ITEMS = '''
+    SELECT COUNT(*),
+           SUM(CASE WHEN is_available = 1 THEN 1 ELSE 0 END),
+           AVG(CASE WHEN is_available = 1 THEN price END)
+    FROM menu_items
+'''
+
+SQL_STATS_CATEGORIES = "SELECT COUNT(*) FROM categories WHERE is_active = 1"
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (ESCAPE '\\')"""
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _item_params(row: Union[Tuple, Dict]) -> Tuple:
+    """SQL_INSERT_ITEM parameters for a tuple row or an add_menu_item-style dict"""
+    if not isinstance(row, dict):
+        return row
+    return (row['name'], row.get('description', ""), row['price'], row['category_id'],
+            row.get('preparation_time', 15), row.get('ingredients', ""),
+            row.get('allergens', ""), row.get('calories', 0))
+
+def _menu_item_factory(cursor: sqlite3.Cursor, row: Tuple) -> MenuItem:
+    """Row factory for queries that already select the category name"""
+    return MenuItem._make(row)
+
+def _with_category_name(row: Tuple, categories: Dict) -> MenuItem:
+    """Build a MenuItem from a row holding category_id, swapping in the name"""
+    category = categories.get(row[4])
+    return MenuItem(row[0], row[1], row[2], row[3], category[1] if category else None,
+                    row[5], row[6], row[7], row[8], row[9])
 
 class MenuManager:
     """Handles menu item operations and category management"""
     
-    def __init__(self, db_manager):
-        """Initialize with a database manager instance"""
+    def __init__(self, db_manager, cache_ttl: Optional[float] = None):
+        """
+        Initialize with a database manager instance
+        cache_ttl: seconds before cached categories are re-read
+        (None keeps them until a category is added, 0 disables caching)
+        """
         self.db = db_manager
-        print("🍽️  Menu Manager initialized")
+        self.cache_ttl = cache_ttl
+        
+        # Categories rarely change, so they are kept in memory between calls
+        self._cat_cache = None
+        self._cat_by_id = None
+        self._cat_loaded_at = 0.0
+        logger.debug("🍽️  Menu Manager initialized")
     
     # ========== MENU ITEM OPERATIONS ==========
     
@@ -23,93 +190,127 @@ class MenuManager:
         """
         Add a new menu item
         Returns True if successful, False if failed
+        (use add_menu_items_bulk when adding several items at once)
         """
-        print(f"➕ Adding menu item: {name}")
+        logger.debug("➕ Adding menu item: %s", name)
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO menu_items (name, description, price, category_id,
-                                      preparation_time, ingredients, allergens, calories)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (name, description, price, category_id, preparation_time,
-                  ingredients, allergens, calories))
+            self.db.execute(SQL_INSERT_ITEM, (name, description, price, category_id,
+                                              preparation_time, ingredients, allergens,
+                                              calories))
             
-            conn.commit()
-            conn.close()
-            
-            print(f"✅ Menu item '{name}' added successfully!")
+            logger.debug("✅ Menu item '%s' added successfully!", name)
             return True
             
         except sqlite3.Error as e:
-            print(f"❌ Failed to add menu item '{name}': {e}")
+            logger.error("❌ Failed to add menu item '%s': %s", name, e)
             return False
     
-    def get_all_menu_items(self) -> List[Tuple]:
-        """Get all menu items with their category names"""
-        print("📋 Fetching all menu items...")
+    def add_menu_items_bulk(self, rows: Iterable[Union[Tuple, Dict]]) -> int:
+        """
+        Add many menu items in one transaction with a single prepared INSERT
+        Each row is (name, description, price, category_id,
+        preparation_time, ingredients, allergens, calories) or a dict with
+        add_menu_item's keyword arguments (optional keys use its defaults)
+        Returns the number of items added (0 if failed - nothing is added)
+        """
+        logger.debug("➕ Adding menu items in bulk...")
         
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        try:
+            # One commit for the whole batch instead of one per item
+            with self.db.transaction() as conn:
+                cursor = conn.executemany(SQL_INSERT_ITEM, map(_item_params, rows))
+            
+        except sqlite3.Error as e:
+            logger.error("❌ Failed to add menu items: %s", e)
+            return 0
         
-        cursor.execute('''
-            SELECT m.item_id, m.name, m.description, m.price, c.name as category,
-                   m.is_available, m.preparation_time, m.ingredients, m.allergens, m.calories
-            FROM menu_items m
-            LEFT JOIN categories c ON m.category_id = c.category_id
-            ORDER BY c.name, m.name
-        ''')
+        logger.debug("✅ %d menu items added successfully!", cursor.rowcount)
         
-        result = cursor.fetchall()
-        conn.close()
+        # Refresh planner statistics after a large change in size; the rows
+        # are already committed, so a failure here doesn't undo the add
+        try:
+            self.db.execute("ANALYZE")
+        except sqlite3.Error as e:
+            logger.warning("⚠️  Could not refresh query statistics: %s", e)
         
-        print(f"✅ Found {len(result)} menu items")
-        return result
+        return cursor.rowcount
     
-    def get_menu_by_category(self, category_id: int) -> List[Tuple]:
-        """Get menu items for a specific category"""
-        print(f"📂 Fetching menu items for category ID: {category_id}")
-        
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+    def iter_all_menu_items(self, limit: Optional[int] = None,
+                            offset: int = 0) -> Iterator[MenuItem]:
+        """
+        Yield menu items with their category names, without building
+        the whole list first. The query stays open on this thread's
+        connection until the iterator is exhausted or closed.
+        limit/offset select one page; limit=None returns every item.
+        """
+        logger.debug("📋 Fetching all menu items...")
         
-        cursor.execute('''
-            SELECT item_id, name, description, price, is_available,
-                   preparation_time, ingredients, allergens, calories
-            FROM menu_items
-            WHERE category_id = ? AND is_available = 1
-            ORDER BY name
-        ''', (category_id,))
+        self._load_categories()
+        categories = self._cat_by_id
         
-        result = cursor.fetchall()
-        conn.close()
+        with self.db.acquire() as conn:
+            cursor = conn.execute(SQL_GET_ALL_ITEMS, page_params(limit, offset))
+            cursor.arraysize = FETCH_BATCH_SIZE
+            
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield _with_category_name(row, categories)
+    
+    def get_all_menu_items(self, limit: Optional[int] = None,
+                           offset: int = 0) -> List[MenuItem]:
+        """Get menu items with their category names (all, or one page)"""
+        result = list(self.iter_all_menu_items(limit, offset))
         
-        print(f"✅ Found {len(result)} items in category")
+        logger.debug("✅ Found %d menu items", len(result))
         return result
     
-    def search_menu_items(self, search_term: str) -> List[Tuple]:
-        """Search menu items by name or description"""
-        print(f"🔍 Searching for: '{search_term}'")
+    def get_menu_by_category(self, category_id: int, limit: Optional[int] = None,
+                             offset: int = 0) -> List[MenuItem]:
+        """Get available menu items for a specific category (all, or one page)"""
+        logger.debug("📂 Fetching menu items for category ID: %s", category_id)
+        
+        self._load_categories()
+        categories = self._cat_by_id
         
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        with self.db.acquire() as conn:
+            rows = conn.execute(SQL_GET_BY_CATEGORY,
+                                (category_id,) + page_params(limit, offset)).fetchall()
         
-        search_pattern = f"%{search_term}%"
-        cursor.execute('''
-            SELECT m.item_id, m.name, m.description, m.price, c.name as category,
-                   m.is_available, m.preparation_time, m.ingredients, m.allergens, m.calories
-            FROM menu_items m
-            LEFT JOIN categories c ON m.category_id = c.category_id
-            WHERE (m.name LIKE ? OR m.description LIKE ?) AND m.is_available = 1
-            ORDER BY m.name
-        ''', (search_pattern, search_pattern))
+        result = [_with_category_name(row, categories) for row in rows]
         
-        result = cursor.fetchall()
-        conn.close()
+        logger.debug("✅ Found %d items in category", len(result))
+        return result
+    
+    def search_menu_items(self, search_term: str, prefix: bool = False,
+                          limit: Optional[int] = None, offset: int = 0) -> List[MenuItem]:
+        """
+        Search menu items by words in their name or description (all, or one page)
+        With prefix=True, only match item names that start with the term
+        """
+        logger.debug("🔍 Searching for: '%s'", search_term)
         
-        print(f"✅ Found {len(result)} matching items")
+        with self.db.acquire() as conn:
+            if prefix:
+                search_pattern = _escape_like(search_term) + "%"
+                cursor = conn.execute(SQL_SEARCH_PREFIX, (search_pattern,) + page_params(limit, offset))
+            elif self.db.fts_enabled:
+                # Quote the term so FTS5 operators in user input are taken
+                # literally, and match it as a prefix ("chick" -> "chicken")
+                search_query = '"' + search_term.replace('"', '""') + '"*'
+                cursor = conn.execute(SQL_SEARCH_FTS, (search_query,) + page_params(limit, offset))
+            else:
+                search_pattern = f"%{_escape_like(search_term)}%"
+                cursor = conn.execute(SQL_SEARCH_LIKE,
+                                      (search_pattern, search_pattern) + page_params(limit, offset))
+            
+            cursor.row_factory = _menu_item_factory
+            result = cursor.fetchall()
+        
+        logger.debug("✅ Found %d matching items", len(result))
         return result
     
     def update_menu_item(self, item_id: int, **kwargs) -> bool:
@@ -118,180 +319,149 @@ class MenuManager:
         kwargs can include: name, description, price, category_id, 
         preparation_time, ingredients, allergens, calories, is_available
         """
-        print(f"✏️ Updating menu item ID: {item_id}")
+        logger.debug("✏️ Updating menu item ID: %s", item_id)
         
         if not kwargs:
-            print("❌ No update data provided")
+            logger.debug("❌ No update data provided")
+            return False
+        
+        unknown_fields = set(kwargs) - set(UPDATABLE_ITEM_FIELDS)
+        if unknown_fields:
+            logger.debug("❌ Unknown update fields: %s", ', '.join(sorted(unknown_fields)))
             return False
         
+        # Fixed column order; fields left out (or None) bind as NULL
+        values = [kwargs.get(field) for field in UPDATABLE_ITEM_FIELDS]
+        
+        if all(value is None for value in values):
+            logger.debug("❌ No valid update fields provided")
+            return False
+        
+        values.append(item_id)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Build dynamic update query
-            updates = []
-            values = []
-            
-            for field, value in kwargs.items():
-                if value is not None:
-                    updates.append(f"{field} = ?")
-                    values.append(value)
-            
-            if not updates:
-                print("❌ No valid update fields provided")
-                return False
-            
-            # Add updated_at timestamp
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(item_id)
-            
-            query = f"UPDATE menu_items SET {', '.join(updates)} WHERE item_id = ?"
-            
-            cursor.execute(query, values)
-            conn.commit()
+            cursor = self.db.execute(SQL_UPDATE_ITEM, values)
             
             if cursor.rowcount > 0:
-                print(f"✅ Menu item {item_id} updated successfully!")
-                conn.close()
+                logger.debug("✅ Menu item %s updated successfully!", item_id)
                 return True
             else:
-                print(f"❌ Menu item {item_id} not found")
-                conn.close()
+                logger.debug("❌ Menu item %s not found", item_id)
                 return False
                 
         except sqlite3.Error as e:
-            print(f"❌ Failed to update menu item {item_id}: {e}")
+            logger.error("❌ Failed to update menu item %s: %s", item_id, e)
             return False
     
     def delete_menu_item(self, item_id: int) -> bool:
         """Delete a menu item (only if not in any orders)"""
-        print(f"🗑️ Attempting to delete menu item ID: {item_id}")
+        logger.debug("🗑️ Attempting to delete menu item ID: %s", item_id)
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
             # For now, just delete directly
             # TODO: In a full system, check for existing orders first
-            cursor.execute("DELETE FROM menu_items WHERE item_id = ?", (item_id,))
-            conn.commit()
+            cursor = self.db.execute(SQL_DELETE_ITEM, (item_id,))
             
             if cursor.rowcount > 0:
-                print(f"✅ Menu item {item_id} deleted successfully!")
-                conn.close()
+                logger.debug("✅ Menu item %s deleted successfully!", item_id)
                 return True
             else:
-                print(f"❌ Menu item {item_id} not found")
-                conn.close()
+                logger.debug("❌ Menu item %s not found", item_id)
                 return False
                 
         except sqlite3.Error as e:
-            print(f"❌ Failed to delete menu item {item_id}: {e}")
+            logger.error("❌ Failed to delete menu item %s: %s", item_id, e)
             return False
     
-    def get_item_by_id(self, item_id: int) -> Optional[Tuple]:
+    def get_item_by_id(self, item_id: int) -> Optional[MenuItem]:
         """Get a specific menu item by ID"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        with self.db.acquire() as conn:
+            row = conn.execute(SQL_GET_ITEM_BY_ID, (item_id,)).fetchone()
         
-        cursor.execute('''
-            SELECT m.item_id, m.name, m.description, m.price, c.name as category,
-                   m.is_available, m.preparation_time, m.ingredients, m.allergens, m.calories
-            FROM menu_items m
-            LEFT JOIN categories c ON m.category_id = c.category_id
-            WHERE m.item_id = ?
-        ''', (item_id,))
+        if row is None:
+            return None
         
-        result = cursor.fetchone()
-        conn.close()
-        return result
+        self._load_categories()
+        return _with_category_name(row, self._cat_by_id)
     
     # ========== CATEGORY OPERATIONS ==========
     
     def add_category(self, name: str, description: str = "") -> bool:
         """Add a new category"""
-        print(f"📂 Adding category: {name}")
+        logger.debug("📂 Adding category: %s", name)
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO categories (name, description)
-                VALUES (?, ?)
-            ''', (name, description))
-            
-            conn.commit()
-            conn.close()
+            self.db.execute(SQL_ADD_CATEGORY, (name, description))
             
-            print(f"✅ Category '{name}' added successfully!")
+            self.invalidate_category_cache()
+            logger.debug("✅ Category '%s' added successfully!", name)
             return True
             
         except sqlite3.IntegrityError:
-            print(f"❌ Category '{name}' already exists!")
+            logger.debug("❌ Category '%s' already exists!", name)
             return False
         except sqlite3.Error as e:
-            print(f"❌ Failed to add category '{name}': {e}")
+            logger.error("❌ Failed to add category '%s': %s", name, e)
             return False
     
     def get_all_categories(self) -> List[Tuple]:
-        """Get all categories"""
-        print("📂 Fetching all categories...")
-        
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT category_id, name, description, is_active
-            FROM categories
-            ORDER BY name
-        ''')
-        
-        result = cursor.fetchall()
-        conn.close()
-        
-        print(f"✅ Found {len(result)} categories")
-        return result
+        """Get all categories (served from the category cache)"""
+        self._load_categories()
+        return self._cat_cache
     
     def get_category_by_id(self, category_id: int) -> Optional[Tuple]:
-        """Get a specific category by ID"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        """Get a specific category by ID (served from the category cache)"""
+        self._load_categories()
+        return self._cat_by_id.get(category_id)
+    
+    def invalidate_category_cache(self):
+        """Force the next category lookup to re-read the database"""
+        self._cat_cache = None
+        self._cat_by_id = None
+    
+    def _load_categories(self):
+        """Fill the category cache if it is empty or older than cache_ttl"""
+        expired = (self.cache_ttl is not None and
+                   time.monotonic() - self._cat_loaded_at >= self.cache_ttl)
+        if self._cat_cache is not None and not expired:
+            return
         
-        cursor.execute('''
-            SELECT category_id, name, description, is_active
-            FROM categories
-            WHERE category_id = ?
-        ''', (category_id,))
+        logger.debug("📂 Fetching all categories...")
         
-        result = cursor.fetchone()
-        conn.close()
-        return result
+        with self.db.acquire() as conn:
+            result = conn.execute(SQL_ALL_CATEGORIES).fetchall()
+        
+        self._cat_cache = result
+        self._cat_by_id = {category[0]: category for category in result}
+        self._cat_loaded_at = time.monotonic()
+        
+        logger.debug("✅ Found %d categories", len(result))
     
     # ========== UTILITY METHODS ==========
     
+    def get_menu_version(self, category_id: Optional[int] = None) -> Tuple[int, Optional[str]]:
+        """
+        (item count, latest updated_at) for all items, or for the available
+        items of one category - a cheap way to tell whether anything built
+        from get_all_menu_items/get_menu_by_category is out of date
+        """
+        with self.db.acquire() as conn:
+            if category_id is None:
+                return tuple(conn.execute(SQL_ITEMS_VERSION).fetchone())
+            return tuple(conn.execute(SQL_CATEGORY_ITEMS_VERSION, (category_id,)).fetchone())
+    
     def get_menu_statistics(self) -> Dict[str, int]:
         """Get statistics about the menu"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        # Total items
-        cursor.execute("SELECT COUNT(*) FROM menu_items")
-        total_items = cursor.fetchone()[0]
-        
-        # Available items
-        cursor.execute("SELECT COUNT(*) FROM menu_items WHERE is_available = 1")
-        available_items = cursor.fetchone()[0]
-        
-        # Total categories
-        cursor.execute("SELECT COUNT(*) FROM categories WHERE is_active = 1")
-        total_categories = cursor.fetchone()[0]
-        
-        # Average price
-        cursor.execute("SELECT AVG(price) FROM menu_items WHERE is_available = 1")
-        avg_price = cursor.fetchone()[0] or 0
+        with self.db.acquire() as conn:
+            # Total items, available items and average price
+            total_items, available_items, avg_price = conn.execute(SQL_STATS_ITEMS).fetchone()
+            
+            # Total categories
+            total_categories = conn.execute(SQL_STATS_CATEGORIES).fetchone()[0]
         
-        conn.close()
+        # SUM/AVG are NULL on an empty menu
+        available_items = available_items or 0
+        avg_price = avg_price or 0
         
         return {
             'total_items': total_items,
@@ -301,16 +471,15 @@ class MenuManager:
             'average_price': round(avg_price, 2)
         }
 
-# Test the menu manager when this file is run directly
+# Test the menu manager when this module is run directly, from the
+# project root: python -m src.restaurant_menu.managers.menu_manager
 if __name__ == "__main__":
     print("Testing Menu Manager...")
     
-    # Import required modules
-    import sys
-    from pathlib import Path
-    sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+    # Show the manager's step-by-step messages while testing
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     
-    from src.restaurant_menu.models.database import DatabaseManager
+    from ..models.database import DatabaseManager
     
     # Create instances
     db = DatabaseManager()
@@ -328,16 +497,14 @@ if __name__ == "__main__":
     
     # Add some sample menu items
     sample_items = [
-        ("Caesar Salad", "Fresh romaine lettuce with parmesan cheese", 12.99, 5, 10),
-        ("Grilled Chicken", "Juicy grilled chicken breast", 18.99, 2, 20),
-        ("Chocolate Cake", "Rich chocolate cake with vanilla ice cream", 8.99, 3, 5),
-        ("Fresh Coffee", "Freshly brewed house coffee", 3.99, 4, 3),
+        ("Caesar Salad", "Fresh romaine lettuce with parmesan cheese", 12.99, 5, 10, "", "", 0),
+        ("Grilled Chicken", "Juicy grilled chicken breast", 18.99, 2, 20, "", "", 0),
+        ("Chocolate Cake", "Rich chocolate cake with vanilla ice cream", 8.99, 3, 5, "", "", 0),
+        ("Fresh Coffee", "Freshly brewed house coffee", 3.99, 4, 3, "", "", 0),
     ]
     
-    for name, desc, price, cat_id, prep_time in sample_items:
-        success = menu_manager.add_menu_item(name, desc, price, cat_id, prep_time)
-        if not success:
-            print(f"  (Item '{name}' might already exist)")
+    added = menu_manager.add_menu_items_bulk(sample_items)
+    print(f"  Added {added} of {len(sample_items)} sample items")
     
     print("\n🧪 Testing menu retrieval...")
     
@@ -345,7 +512,7 @@ if __name__ == "__main__":
     all_items = menu_manager.get_all_menu_items()
     print(f"\nAll menu items ({len(all_items)}):")
     for item in all_items:
-        print(f"  {item[0]}. {item[1]} - ${item[3]:.2f} ({item[4]})")
+        print(f"  {item.item_id}. {item.name} - ${item.price:.2f} ({item.category})")
     
     print("\n🧪 Testing search functionality...")
     
@@ -353,7 +520,7 @@ if __name__ == "__main__":
     search_results = menu_manager.search_menu_items("chicken")
     print(f"\nSearch results for 'chicken' ({len(search_results)}):")
     for item in search_results:
-        print(f"  {item[0]}. {item[1]} - ${item[3]:.2f}")
+        print(f"  {item.item_id}. {item.name} - ${item.price:.2f}")
     
     print("\n🧪 Testing statistics...")
     
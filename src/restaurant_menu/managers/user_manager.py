@@ -3,8 +3,57 @@ User Manager for Restaurant Menu System
 Handles user authentication and management
 """
 
+import asyncio
+import hmac
+import logging
 import sqlite3
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
+
+from ..models.database import FETCH_BATCH_SIZE, page_params
+from ..models.records import User
+
+logger = logging.getLogger(__name__)
+
+# Hashed against when the username doesn't exist, so an unknown user takes
+# as long to reject as a wrong password (no username enumeration by timing)
+DUMMY_SALT_HEX = "00" * 16
+DUMMY_PASSWORD_HASH = "0" * 64
+
+def _user_factory(cursor: sqlite3.Cursor, row: Tuple) -> User:
+    """Row factory for the user listing queries"""
+    return User._make(row)
+
+# Module-level SQL so sqlite3's statement cache reuses the prepared statements
+
+# Look up by username only (a unique-index seek); the hash is compared in Python
+SQL_AUTH = '''
+    SELECT user_id, username, role, full_name, email, password_hash, password_salt
+    FROM users
+    WHERE username = ?
+'''
+
+SQL_REGISTER = '''
+    INSERT INTO users (username, password_hash, password_salt, role, full_name, email)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SQL_SET_PASSWORD = '''
+    UPDATE users SET password_hash = ?, password_salt = ?
+    WHERE user_id = ?
+'''
+
+SQL_ALL_USERS = '''
+    SELECT user_id, username, role, full_name, email, created_at 
+    FROM users
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+'''
+
+SQL_USER_BY_ID = '''
+    SELECT user_id, username, role, full_name, email, created_at
+    FROM users
+    WHERE user_id = ?
+'''
 
 class UserManager:
     """Handles user authentication and user management operations"""
@@ -12,116 +61,132 @@ class UserManager:
     def __init__(self, db_manager):
         """Initialize with a database manager instance"""
         self.db = db_manager
-        print("👤 User Manager initialized")
+        logger.debug("👤 User Manager initialized")
     
-    def authenticate_user(self, username: str, password: str) -> Optional[Tuple]:
+    def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """
         Authenticate a user with username and password
         Returns user info if successful, None if failed
         """
-        print(f"🔐 Attempting to authenticate user: {username}")
-        
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        logger.debug("🔐 Attempting to authenticate user: %s", username)
         
-        # Hash the provided password
-        password_hash = self.db.hash_password(password)
+        # Query database for user (the salt is needed before hashing)
+        with self.db.acquire() as conn:
+            row = conn.execute(SQL_AUTH, (username,)).fetchone()
         
-        # Query database for user
-        cursor.execute('''
-            SELECT user_id, username, role, full_name, email 
-            FROM users
-            WHERE username = ? AND password_hash = ?
-        ''', (username, password_hash))
-        
-        result = cursor.fetchone()
-        conn.close()
+        if row is None:
+            _, password_hash = self.db.hash_password(password, DUMMY_SALT_HEX)
+            hmac.compare_digest(DUMMY_PASSWORD_HASH, password_hash)
+            logger.debug("❌ Authentication failed for %s", username)
+            return None
         
-        if result:
-            print(f"✅ Authentication successful for {username} ({result[2]})")
+        if self._password_matches(row, password):
+            result = User(*row[:5])
+            logger.debug("✅ Authentication successful for %s (%s)", username, result.role)
             return result
         else:
-            print(f"❌ Authentication failed for {username}")
+            logger.debug("❌ Authentication failed for %s", username)
             return None
     
+    async def authenticate_user_async(self, username: str, password: str) -> Optional[User]:
+        """Same as authenticate_user, without blocking the event loop"""
+        # Lookup and hashing run in a worker thread on its own connection
+        return await asyncio.to_thread(self.authenticate_user, username, password)
+    
+    def _password_matches(self, row: Tuple, password: str) -> bool:
+        """
+        Check a password against a user row from SQL_AUTH
+        Accounts still on the old unsalted SHA-256 hash are upgraded on success
+        """
+        user_id, stored_hash, salt_hex = row[0], row[5], row[6]
+        
+        if salt_hex is None:
+            password_hash = self.db.legacy_hash_password(password)
+        else:
+            _, password_hash = self.db.hash_password(password, salt_hex)
+        
+        # Constant-time compare so response time doesn't leak hash prefixes
+        if not hmac.compare_digest(stored_hash, password_hash):
+            return False
+        
+        if salt_hex is None:
+            salt_hex, password_hash = self.db.hash_password(password)
+            self.db.execute(SQL_SET_PASSWORD, (password_hash, salt_hex, user_id))
+            logger.debug("🔑 Upgraded password hash for user %s", user_id)
+        
+        return True
+    
     def register_user(self, username: str, password: str, role: str = "staff", 
                      full_name: str = "", email: str = "") -> bool:
         """
         Register a new user
         Returns True if successful, False if username already exists
         """
-        print(f"📝 Attempting to register new user: {username}")
+        logger.debug("📝 Attempting to register new user: %s", username)
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
             # Hash the password
-            password_hash = self.db.hash_password(password)
+            salt_hex, password_hash = self.db.hash_password(password)
             
             # Insert new user
-            cursor.execute('''
-                INSERT INTO users (username, password_hash, role, full_name, email)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (username, password_hash, role, full_name, email))
-            
-            conn.commit()
-            conn.close()
+            self.db.execute(SQL_REGISTER, (username, password_hash, salt_hex,
+                                           role, full_name, email))
             
-            print(f"✅ User '{username}' registered successfully!")
+            logger.debug("✅ User '%s' registered successfully!", username)
             return True
             
         except sqlite3.IntegrityError:
-            print(f"❌ Username '{username}' already exists!")
+            logger.debug("❌ Username '%s' already exists!", username)
             return False
         except Exception as e:
-            print(f"❌ Registration failed: {e}")
+            logger.error("❌ Registration failed: %s", e)
             return False
     
-    def get_all_users(self) -> List[Tuple]:
-        """Get all users (for admin use)"""
-        print("👥 Fetching all users...")
-        
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT user_id, username, role, full_name, email, created_at 
-            FROM users
-            ORDER BY created_at DESC
-        ''')
+    def iter_all_users(self, limit: Optional[int] = None,
+                       offset: int = 0) -> Iterator[User]:
+        """
+        Yield users (for admin use) without building the whole list
+        first. The query stays open on this thread's connection until
+        the iterator is exhausted or closed.
+        limit/offset select one page; limit=None returns every user.
+        """
+        logger.debug("👥 Fetching all users...")
         
-        result = cursor.fetchall()
-        conn.close()
+        with self.db.acquire() as conn:
+            cursor = conn.execute(SQL_ALL_USERS, page_params(limit, offset))
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.row_factory = _user_factory
+            
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+    
+    def get_all_users(self, limit: Optional[int] = None,
+                      offset: int = 0) -> List[User]:
+        """Get users (for admin use) - all, or one page"""
+        result = list(self.iter_all_users(limit, offset))
         
-        print(f"✅ Found {len(result)} users")
+        logger.debug("✅ Found %d users", len(result))
         return result
     
-    def get_user_info(self, user_id: int) -> Optional[Tuple]:
+    def get_user_info(self, user_id: int) -> Optional[User]:
         """Get information for a specific user"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT user_id, username, role, full_name, email, created_at
-            FROM users
-            WHERE user_id = ?
-        ''', (user_id,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        return result
+        with self.db.acquire() as conn:
+            cursor = conn.execute(SQL_USER_BY_ID, (user_id,))
+            cursor.row_factory = _user_factory
+            return cursor.fetchone()
 
-# Test the user manager when this file is run directly
+# Test the user manager when this module is run directly, from the
+# project root: python -m src.restaurant_menu.managers.user_manager
 if __name__ == "__main__":
     print("Testing User Manager...")
     
-    # Import database manager
-    import sys
-    from pathlib import Path
-    sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+    # Show the manager's step-by-step messages while testing
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     
-    from src.restaurant_menu.models.database import DatabaseManager
+    from ..models.database import DatabaseManager
     
     # Create instances
     db = DatabaseManager()
@@ -155,6 +220,6 @@ if __name__ == "__main__":
     print("\n👥 All users:")
     users = user_manager.get_all_users()
     for user in users:
-        print(f"  - {user[1]} ({user[2]}) - {user[3]}")
+        print(f"  - {user.username} ({user.role}) - {user.full_name}")
     
     print("\n✅ User Manager testing completed!")
\ No newline at end of file
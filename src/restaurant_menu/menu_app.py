@@ -3,55 +3,164 @@ Complete Menu Management Application
 Combines all menu management functionality with user authentication
 """
 
+import csv
 import sys
-import os
-from typing import Optional, Tuple
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from .models.database import DatabaseManager
-from .managers.user_manager import UserManager
-from .managers.menu_manager import MenuManager
-from .ui.menu_cli import MenuCLI
+from .ui.console import clear_screen, read_line, write_bytes
+from .ui.menu_cli import (MIN_CALORIES, MIN_PREPARATION_TIME, MIN_PRICE, NO_ITEMS_BYTES,
+                          MenuCLI, number_in_range)
+
+# The managers (and sqlite3/hashlib behind them) are imported on first use
+if TYPE_CHECKING:
+    from .models.database import DatabaseManager
+    from .managers.user_manager import UserManager
+    from .managers.menu_manager import MenuManager
+
+# Items per page in View All Menu Items
+MENU_PAGE_SIZE = 50
+
+# Columns read by Bulk Add Items from CSV; only name, price and
+# category_id are required
+CSV_ITEM_COLUMNS = ("name", "description", "price", "category_id",
+                    "preparation_time", "ingredients", "allergens", "calories")
+
+# Screens are built once and printed with a single call
+WELCOME_SCREEN = "\n".join([
+    "=" * 60,
+    "        🍽️  RESTAURANT MENU MANAGEMENT SYSTEM  🍽️",
+    "=" * 60,
+    "             Welcome to your digital menu!",
+    "=" * 60,
+])
+
+LOGIN_MENU = "\n".join([
+    "\n--- 🔐 AUTHENTICATION ---",
+    "1. 🔑 Login",
+    "2. 📝 Register New Staff",
+    "3. 🚪 Exit",
+    "-" * 30,
+])
+
+ADMIN_MENU_TEMPLATE = "\n".join([
+    "\n--- 👑 ADMIN PANEL - {name} ---",
+    "📋 MENU MANAGEMENT:",
+    "  1. 👀 View All Menu Items",
+    "  2. ➕ Add New Menu Item",
+    "  3. ✏️  Update Menu Item",
+    "  4. 🗑️  Delete Menu Item",
+    "  5. 🔍 Search Menu Items",
+    "  11. 📥 Bulk Add Items from CSV",
+    "\n📂 CATEGORY MANAGEMENT:",
+    "  6. 📂 View Categories",
+    "  7. ➕ Add New Category",
+    "\n📊 REPORTS & INFO:",
+    "  8. 📊 Menu Statistics",
+    "  9. 👥 View All Users",
+    "\n🔧 SYSTEM:",
+    "  10. 🚪 Logout",
+    "-" * 50,
+])
+
+STAFF_MENU_TEMPLATE = "\n".join([
+    "\n--- 👨‍🍳 STAFF PANEL - {name} ---",
+    "📋 MENU OPERATIONS:",
+    "  1. 👀 View All Menu Items",
+    "  2. 🔍 Search Menu Items",
+    "  3. 📂 Browse by Category",
+    "  4. 📊 Menu Statistics",
+    "\n🔧 SYSTEM:",
+    "  5. 🚪 Logout",
+    "-" * 40,
+])
+
+def _encode_screen(template: str) -> Tuple[bytes, bytes]:
+    """UTF-8 bytes of a screen (plus print's newline) before and after its {name} field"""
+    before, after = (template + "\n").split("{name}")
+    return before.encode("utf-8"), after.encode("utf-8")
+
+# The same screens, encoded once at import instead of on every paint
+WELCOME_SCREEN_BYTES = (WELCOME_SCREEN + "\n").encode("utf-8")
+LOGIN_MENU_BYTES = (LOGIN_MENU + "\n").encode("utf-8")
+ADMIN_MENU_PREFIX, ADMIN_MENU_SUFFIX = _encode_screen(ADMIN_MENU_TEMPLATE)
+STAFF_MENU_PREFIX, STAFF_MENU_SUFFIX = _encode_screen(STAFF_MENU_TEMPLATE)
+
+USERS_TABLE_HEADER_TEMPLATE = "\n".join([
+    "\n👥 SYSTEM USERS ({count} total):",
+    "=" * 80,
+    f"{'ID':<4} {'Username':<15} {'Role':<8} {'Full Name':<20} {'Email':<20}",
+    "=" * 80,
+])
+
+# One users table row; the .19 precision truncates long names and emails
+USER_ROW_TEMPLATE = "{:<4} {:<15} {:<8} {:<20.19} {:<20.19}"
 
 class MenuManagementApp:
     """Complete Menu Management Application"""
     
-    def __init__(self):
-        """Initialize the application"""
-        print("🍽️  Initializing Restaurant Menu Management System...")
-        
-        # Initialize core components
-        self.db_manager = DatabaseManager()
-        self.user_manager = UserManager(self.db_manager)
-        self.menu_manager = MenuManager(self.db_manager)
-        self.menu_cli = MenuCLI(self.menu_manager, self.user_manager)
-        
+    def __init__(self, lazy: bool = False):
+        """
+        Initialize the application
+        With lazy=True the database is not opened (or created and seeded)
+        until a component is first used
+        """
         # Current user session
         self.current_user = None
+        self._is_admin = False
+        
+        # Formatted menu tables as UTF-8 bytes, keyed by (category_id,
+        # show_details, limit, offset) and stored with the menu version
+        # they were built from
+        self._display_cache = {}
+        
+        if not lazy:
+            self._start()
+    
+    def _start(self):
+        """Create every component now, opening (and if needed seeding) the database"""
+        print("🍽️  Initializing Restaurant Menu Management System...")
+        
+        # Initialize core components (each cached_property builds its
+        # component on first access, opening the database first)
+        for component in ("db_manager", "user_manager", "menu_manager", "menu_cli"):
+            getattr(self, component)
         
         print("✅ Application initialized successfully!")
     
-    def clear_screen(self):
-        """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+    @cached_property
+    def db_manager(self) -> "DatabaseManager":
+        """Database manager, created (and the database initialized) on first use"""
+        from .models.database import DatabaseManager
+        return DatabaseManager()
+    
+    @cached_property
+    def user_manager(self) -> "UserManager":
+        """User manager, created on first use"""
+        from .managers.user_manager import UserManager
+        return UserManager(self.db_manager)
+    
+    @cached_property
+    def menu_manager(self) -> "MenuManager":
+        """Menu manager, created on first use"""
+        from .managers.menu_manager import MenuManager
+        return MenuManager(self.db_manager)
+    
+    @cached_property
+    def menu_cli(self) -> MenuCLI:
+        """Menu CLI, created on first use"""
+        return MenuCLI(self.menu_manager, self.user_manager)
     
     def show_welcome(self):
         """Display welcome screen"""
-        self.clear_screen()
-        print("=" * 60)
-        print("        🍽️  RESTAURANT MENU MANAGEMENT SYSTEM  🍽️")
-        print("=" * 60)
-        print("             Welcome to your digital menu!")
-        print("=" * 60)
+        clear_screen()
+        write_bytes(WELCOME_SCREEN_BYTES)
     
     def show_login_menu(self):
         """Display login/registration menu"""
-        print("\n--- 🔐 AUTHENTICATION ---")
-        print("1. 🔑 Login")
-        print("2. 📝 Register New Staff")
-        print("3. 🚪 Exit")
-        print("-" * 30)
+        write_bytes(LOGIN_MENU_BYTES)
         
-        choice = input("Enter your choice (1-3): ").strip()
+        choice = read_line("Enter your choice (1-3): ").strip()
         return choice
     
     def handle_login(self):
@@ -62,12 +171,12 @@ class MenuManagementApp:
         print("  👨‍🍳 Staff: username='staff', password='staff123'")
         print()
         
-        username = input("Username: ").strip()
+        username = read_line("Username: ").strip()
         if not username:
             print("❌ Username cannot be empty.")
             return False
         
-        password = input("Password: ").strip()
+        password = read_line("Password: ").strip()
         if not password:
             print("❌ Password cannot be empty.")
             return False
@@ -75,81 +184,62 @@ class MenuManagementApp:
         user = self.user_manager.authenticate_user(username, password)
         if user:
             self.current_user = user
-            self.clear_screen()
-            print(f"🎉 Welcome, {user[3] or user[1]}!")
-            print(f"👤 Role: {user[2].title()}")
+            # Checked on every trip round the main loop
+            self._is_admin = user.role == 'admin'
+            clear_screen()
+            print(f"🎉 Welcome, {user.display_name}!")
+            print(f"👤 Role: {user.role.title()}")
             return True
         else:
             print("❌ Invalid credentials. Please try again.")
-            input("Press Enter to continue...")
+            read_line("Press Enter to continue...")
             return False
     
     def handle_registration(self):
         """Handle new staff registration"""
         print("\n--- 📝 REGISTER NEW STAFF ---")
         
-        username = input("Username: ").strip()
+        username = read_line("Username: ").strip()
         if not username:
             print("❌ Username cannot be empty.")
             return
         
-        password = input("Password: ").strip()
+        password = read_line("Password: ").strip()
         if not password:
             print("❌ Password cannot be empty.")
             return
         
-        full_name = input("Full Name: ").strip()
-        email = input("Email: ").strip()
+        full_name = read_line("Full Name: ").strip()
+        email = read_line("Email: ").strip()
         
         if self.user_manager.register_user(username, password, "staff", full_name, email):
             print("✅ Registration successful! You can now login.")
         else:
             print("❌ Registration failed. Username might already exist.")
         
-        input("Press Enter to continue...")
+        read_line("Press Enter to continue...")
     
     def show_main_menu(self):
         """Show main menu based on user role"""
-        if self.current_user[2] == 'admin':
+        if self._is_admin:
             return self.show_admin_menu()
         else:
             return self.show_staff_menu()
     
     def show_admin_menu(self):
         """Show admin menu"""
-        print(f"\n--- 👑 ADMIN PANEL - {self.current_user[3] or self.current_user[1]} ---")
-        print("📋 MENU MANAGEMENT:")
-        print("  1. 👀 View All Menu Items")
-        print("  2. ➕ Add New Menu Item") 
-        print("  3. ✏️  Update Menu Item")
-        print("  4. 🗑️  Delete Menu Item")
-        print("  5. 🔍 Search Menu Items")
-        print("\n📂 CATEGORY MANAGEMENT:")
-        print("  6. 📂 View Categories")
-        print("  7. ➕ Add New Category")
-        print("\n📊 REPORTS & INFO:")
-        print("  8. 📊 Menu Statistics")
-        print("  9. 👥 View All Users")
-        print("\n🔧 SYSTEM:")
-        print("  10. 🚪 Logout")
-        print("-" * 50)
-        
-        choice = input("Enter your choice (1-10): ").strip()
+        name = self.current_user.display_name.encode("utf-8")
+        write_bytes(ADMIN_MENU_PREFIX + name + ADMIN_MENU_SUFFIX)
+        
+        choice = read_line("Enter your choice (1-11): ").strip()
         return choice
     
     def show_staff_menu(self):
         """Show staff menu"""
-        print(f"\n--- 👨‍🍳 STAFF PANEL - {self.current_user[3] or self.current_user[1]} ---")
-        print("📋 MENU OPERATIONS:")
-        print("  1. 👀 View All Menu Items")
-        print("  2. 🔍 Search Menu Items")
-        print("  3. 📂 Browse by Category")
-        print("  4. 📊 Menu Statistics")
-        print("\n🔧 SYSTEM:")
-        print("  5. 🚪 Logout")
-        print("-" * 40)
-        
-        choice = input("Enter your choice (1-5): ").strip()
+        name = self.current_user.display_name.encode("utf-8")
+        write_bytes(STAFF_MENU_PREFIX + name + STAFF_MENU_SUFFIX)
+        
+        choice = read_line("Enter your choice (1-5): ").strip()
         return choice
     
     def handle_admin_choice(self, choice: str):
@@ -160,8 +250,10 @@ class MenuManagementApp:
             self.add_menu_item()
         elif choice == '3':
             self.menu_cli.update_menu_item_interface()
+            self._display_cache.clear()
         elif choice == '4':
             self.menu_cli.delete_menu_item_interface()
+            self._display_cache.clear()
         elif choice == '5':
             self.menu_cli.search_menu_interface()
         elif choice == '6':
@@ -176,6 +268,9 @@ class MenuManagementApp:
         elif choice == '10':
             self.logout()
             return False
+        elif choice == '11':
+            # Numbered after the original options so existing choices keep their numbers
+            self.bulk_add_menu_items()
         else:
             print("❌ Invalid choice. Please try again.")
             self.menu_cli.pause()
@@ -206,25 +301,19 @@ class MenuManagementApp:
         """View all menu items"""
         self.menu_cli.show_menu_header("👀 ALL MENU ITEMS")
         
-        items = self.menu_manager.get_all_menu_items()
+        version = self.menu_manager.get_menu_version()
         
-        if not items:
+        if not version[0]:
             print("📭 No menu items found.")
         else:
-            show_details = self.menu_cli.get_user_choice(
-                "Show detailed view? (y/n)", ['y', 'yes', 'n', 'no']
-            )
-            
-            detailed = show_details in ['y', 'yes']
-            self.menu_cli.display_menu_items(items, show_details=detailed)
+            detailed = self.menu_cli.ask_yes_no("Show detailed view? (y/n)")
+            self.page_menu_items(version, detailed)
             
             if not detailed:
                 # Option to view specific item details
-                view_item = self.menu_cli.get_user_choice(
-                    "View specific item details? (y/n)", ['y', 'yes', 'n', 'no']
-                )
+                view_item = self.menu_cli.ask_yes_no("View specific item details? (y/n)")
                 
-                if view_item in ['y', 'yes']:
+                if view_item:
                     item_id = self.menu_cli.get_number_input("Enter Item ID", min_val=1)
                     if item_id:
                         item = self.menu_manager.get_item_by_id(int(item_id))
@@ -243,6 +332,7 @@ class MenuManagementApp:
         
         if item_data:
             if self.menu_manager.add_menu_item(**item_data):
+                self._display_cache.clear()
                 print("✅ Menu item added successfully!")
             else:
                 print("❌ Failed to add menu item.")
@@ -251,6 +341,85 @@ class MenuManagementApp:
         
         self.menu_cli.pause()
     
+    def bulk_add_menu_items(self):
+        """Add menu items from a CSV file in a single transaction"""
+        self.menu_cli.show_menu_header("📥 BULK ADD ITEMS FROM CSV")
+        print(f"Columns: {', '.join(CSV_ITEM_COLUMNS)}")
+        
+        path = read_line("CSV file path: ").strip()
+        if not path:
+            print("❌ File path is required.")
+            self.menu_cli.pause()
+            return
+        
+        rows = []
+        
+        try:
+            # utf-8-sig drops the BOM spreadsheet exports put before the header
+            with open(path, newline='', encoding='utf-8-sig') as csv_file:
+                reader = csv.DictReader(csv_file)
+                
+                # Line 1 is the header
+                for line_no, record in enumerate(reader, start=2):
+                    try:
+                        rows.append(self._parse_csv_item(record))
+                    except (ValueError, TypeError) as e:
+                        print(f"❌ Line {line_no} skipped: {e}")
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"❌ Could not read '{path}': {e}")
+            self.menu_cli.pause()
+            return
+        
+        if not rows:
+            print("📭 No valid menu items found.")
+        else:
+            added = self.menu_manager.add_menu_items_bulk(rows)
+            if added:
+                self._display_cache.clear()
+                print(f"✅ {added} menu items added successfully!")
+            else:
+                print("❌ Failed to add menu items.")
+        
+        self.menu_cli.pause()
+    
+    def _parse_csv_item(self, record: dict) -> dict:
+        """Turn one CSV record into add_menu_item arguments (ValueError if invalid)"""
+        def field(column: str) -> str:
+            return (record.get(column) or "").strip()
+        
+        name = field("name")
+        if not name:
+            raise ValueError("item name is required")
+        
+        # Checked with the same rule and bounds as the Add New Menu Item form
+        price = float(field("price"))
+        if not number_in_range(price, MIN_PRICE):
+            raise ValueError(f"price must be a number of at least {MIN_PRICE}")
+        
+        category_id = int(field("category_id"))
+        if self.menu_manager.get_category_by_id(category_id) is None:
+            raise ValueError(f"category ID {category_id} does not exist")
+        
+        preparation_time = float(field("preparation_time") or 15)
+        if not number_in_range(preparation_time, MIN_PREPARATION_TIME):
+            raise ValueError("preparation time must be a number of at least "
+                             f"{MIN_PREPARATION_TIME} minute")
+        
+        calories = float(field("calories") or 0)
+        if not number_in_range(calories, MIN_CALORIES):
+            raise ValueError(f"calories must be a number of at least {MIN_CALORIES}")
+        
+        return {
+            'name': name,
+            'description': field("description"),
+            'price': price,
+            'category_id': category_id,
+            'preparation_time': int(preparation_time),
+            'ingredients': field("ingredients"),
+            'allergens': field("allergens"),
+            'calories': int(calories)
+        }
+    
     def view_categories(self):
         """View all categories"""
         self.menu_cli.show_menu_header("📂 ALL CATEGORIES")
@@ -260,24 +429,16 @@ class MenuManagementApp:
         
         if categories:
             # Option to view items in a category
-            view_items = self.menu_cli.get_user_choice(
-                "View items in a specific category? (y/n)", ['y', 'yes', 'n', 'no']
-            )
+            view_items = self.menu_cli.ask_yes_no("View items in a specific category? (y/n)")
             
-            if view_items in ['y', 'yes']:
+            if view_items:
                 cat_id = self.menu_cli.get_number_input("Enter Category ID", min_val=1)
                 if cat_id:
-                    items = self.menu_manager.get_menu_by_category(int(cat_id))
-                    if items:
-                        category = self.menu_manager.get_category_by_id(int(cat_id))
+                    category = self.menu_manager.get_category_by_id(int(cat_id))
+                    version = self.menu_manager.get_menu_version(int(cat_id))
+                    if category and version[0]:
                         print(f"\n🍽️  Items in '{category[1]}':")
-                        # Convert items to display format
-                        display_items = []
-                        for item in items:
-                            # Add category name for display consistency
-                            display_item = item[:4] + (category[1],) + item[4:]
-                            display_items.append(display_item)
-                        self.menu_cli.display_menu_items(display_items)
+                        self.show_menu_table(int(cat_id), version)
                     else:
                         print(f"📭 No items found in category {int(cat_id)}.")
         
@@ -287,15 +448,16 @@ class MenuManagementApp:
         """Add new category"""
         self.menu_cli.show_menu_header("➕ ADD NEW CATEGORY")
         
-        name = input("Category Name: ").strip()
+        name = read_line("Category Name: ").strip()
         if not name:
             print("❌ Category name is required.")
             self.menu_cli.pause()
             return
         
-        description = input("Description (optional): ").strip()
+        description = read_line("Description (optional): ").strip()
         
         if self.menu_manager.add_category(name, description):
+            self._display_cache.clear()
             print("✅ Category added successfully!")
         else:
             print("❌ Failed to add category. Name might already exist.")
@@ -326,22 +488,71 @@ class MenuManagementApp:
             self.menu_cli.pause()
             return
         
-        items = self.menu_manager.get_menu_by_category(cat_id)
+        version = self.menu_manager.get_menu_version(cat_id)
         
-        if items:
+        if version[0]:
             print(f"\n🍽️  Items in '{category[1]}':")
-            # Convert items to display format
-            display_items = []
-            for item in items:
-                # Add category name for display consistency
-                display_item = item[:4] + (category[1],) + item[4:]
-                display_items.append(display_item)
-            self.menu_cli.display_menu_items(display_items, show_details=True)
+            self.show_menu_table(cat_id, version, show_details=True)
         else:
             print(f"📭 No items found in '{category[1]}'.")
         
         self.menu_cli.pause()
     
+    def page_menu_items(self, version: Tuple, show_details: bool = False):
+        """Show all menu items one page at a time, fetching only the page shown"""
+        pages = -(-version[0] // MENU_PAGE_SIZE)
+        page = 0
+        
+        while True:
+            self.show_menu_table(None, version, show_details,
+                                 limit=MENU_PAGE_SIZE, offset=page * MENU_PAGE_SIZE)
+            if pages <= 1:
+                return
+            
+            print(f"\n📄 Page {page + 1} of {pages}")
+            choice = self.menu_cli.get_user_choice(
+                "[N]ext page, [P]revious page or [D]one (n/p/d)", ['n', 'p', 'd']
+            )
+            
+            if choice == 'd':
+                return
+            elif choice == 'n' and page + 1 < pages:
+                page += 1
+            elif choice == 'p' and page > 0:
+                page -= 1
+            else:
+                print("❌ No more pages in that direction.")
+    
+    def show_menu_table(self, category_id: Optional[int], version: Tuple,
+                        show_details: bool = False, limit: Optional[int] = None,
+                        offset: int = 0):
+        """
+        Print the items table for every item (category_id=None) or one category,
+        optionally just one page of it, reusing the formatted and encoded
+        table while the menu version is unchanged
+        """
+        key = (category_id, show_details, limit, offset)
+        cached = self._display_cache.get(key)
+        
+        if cached and cached[0] == version:
+            table = cached[1]
+        else:
+            if category_id is None:
+                items = self.menu_manager.iter_all_menu_items(limit, offset)
+            else:
+                items = self.menu_manager.get_menu_by_category(category_id, limit, offset)
+            # A page's title gives its place in the whole list
+            total = version[0] if limit is not None else None
+            lines = self.menu_cli.format_menu_items(items, show_details, total, offset)
+            if lines:
+                table = ("\n".join(lines) + "\n").encode("utf-8")
+            else:
+                # The items were removed after the version was read
+                table = NO_ITEMS_BYTES
+            self._display_cache[key] = (version, table)
+        
+        write_bytes(table)
+    
     def view_all_users(self):
         """View all users (admin only)"""
         self.menu_cli.show_menu_header("👥 ALL USERS")
@@ -351,24 +562,26 @@ class MenuManagementApp:
         if not users:
             print("📭 No users found.")
         else:
-            print(f"\n👥 SYSTEM USERS ({len(users)} total):")
-            print("=" * 80)
-            print(f"{'ID':<4} {'Username':<15} {'Role':<8} {'Full Name':<20} {'Email':<20}")
-            print("=" * 80)
+            print(USERS_TABLE_HEADER_TEMPLATE.format(count=len(users)))
             
-            for user in users:
-                print(f"{user[0]:<4} {user[1]:<15} {user[2]:<8} "
-                      f"{(user[3] or 'Not set')[:19]:<20} {(user[4] or 'Not set')[:19]:<20}")
+            # Build the whole table and write it in one go
+            row = USER_ROW_TEMPLATE.format
+            sys.stdout.write("".join(
+                row(user.user_id, user.username, user.role,
+                    user.full_name or 'Not set', user.email or 'Not set') + "\n"
+                for user in users
+            ))
         
         self.menu_cli.pause()
     
     def logout(self):
         """Logout current user"""
-        name = self.current_user[3] or self.current_user[1]
-        print(f"\n👋 Goodbye, {name}!")
+        print(f"\n👋 Goodbye, {self.current_user.display_name}!")
         print("Logging out...")
         self.current_user = None
-        self.clear_screen()
+        self._is_admin = False
+        self._display_cache.clear()
+        clear_screen()
     
     def run(self):
         """Main application loop"""
@@ -395,7 +608,7 @@ class MenuManagementApp:
                     # Main application loop
                     choice = self.show_main_menu()
                     
-                    if self.current_user[2] == 'admin':
+                    if self._is_admin:
                         continue_app = self.handle_admin_choice(choice)
                     else:
                         continue_app = self.handle_staff_choice(choice)
@@ -3,10 +3,162 @@ Database Manager for Restaurant Menu System
 Handles all database operations using SQLite
 """
 
+import atexit
+import os
 import sqlite3
 import hashlib
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
+
+# Applied once to every new connection. WAL with synchronous=NORMAL only
+# fsyncs at checkpoints rather than on every commit; a power loss can drop
+# the last transaction but never corrupts the database.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    # Case-insensitive LIKE, which lets prefix searches use the NOCASE name index
+    "PRAGMA case_sensitive_like=OFF",
+    # Enforce menu_items.category_id -> categories (off by default in SQLite)
+    "PRAGMA foreign_keys=ON",
+)
+
+# PBKDF2-HMAC-SHA256 rounds for stored passwords (raise as hardware gets faster)
+PASSWORD_HASH_ITERATIONS = 200_000
+
+# Rows the managers pull from SQLite per fetch when streaming results
+FETCH_BATCH_SIZE = 256
+
+def page_params(limit: Optional[int], offset: int) -> Tuple[int, int]:
+    """LIMIT/OFFSET parameters for the managers' list queries (SQLite reads -1 as no limit)"""
+    return (-1 if limit is None else limit, offset)
+
+# Schema and setup SQL, kept at module level like the managers' queries
+
+SQL_CREATE_USERS = '''
+    CREATE TABLE IF NOT EXISTS users (
+        user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role TEXT DEFAULT 'staff',
+        full_name TEXT,
+        email TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        password_salt TEXT
+    )
+'''
+
+SQL_USERS_COLUMNS = "PRAGMA table_info(users)"
+
+SQL_ADD_PASSWORD_SALT = "ALTER TABLE users ADD COLUMN password_salt TEXT"
+
+SQL_CREATE_CATEGORIES = '''
+    CREATE TABLE IF NOT EXISTS categories (
+        category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        description TEXT,
+        is_active BOOLEAN DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+SQL_CREATE_MENU_ITEMS = '''
+    CREATE TABLE IF NOT EXISTS menu_items (
+        item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        description TEXT,
+        price DECIMAL(10,2) NOT NULL,
+        category_id INTEGER,
+        is_available BOOLEAN DEFAULT 1,
+        preparation_time INTEGER DEFAULT 15,
+        ingredients TEXT,
+        allergens TEXT,
+        calories INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories (category_id)
+    )
+'''
+
+SQL_CREATE_INDEXES = (
+    # Browsing by category and listing available items
+    '''
+        CREATE INDEX IF NOT EXISTS idx_menu_items_category
+        ON menu_items (category_id, is_available)
+    ''',
+    '''
+        CREATE INDEX IF NOT EXISTS idx_menu_items_available_name
+        ON menu_items (is_available, name)
+    ''',
+    # Prefix searches on item names (name LIKE 'term%')
+    '''
+        CREATE INDEX IF NOT EXISTS idx_menu_items_name
+        ON menu_items (name COLLATE NOCASE)
+    ''',
+    # Listing/filtering users by role
+    '''
+        CREATE INDEX IF NOT EXISTS idx_users_role
+        ON users (role)
+    ''',
+)
+
+SQL_FTS_EXISTS = "SELECT COUNT(*) FROM sqlite_master WHERE name = 'menu_items_fts'"
+
+SQL_CREATE_FTS = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS menu_items_fts USING fts5(
+        name, description,
+        content='menu_items', content_rowid='item_id'
+    )
+'''
+
+# Keep menu_items_fts in step with inserts, deletes and edits of menu_items
+SQL_CREATE_FTS_TRIGGERS = (
+    '''
+        CREATE TRIGGER IF NOT EXISTS menu_items_fts_insert
+        AFTER INSERT ON menu_items BEGIN
+            INSERT INTO menu_items_fts (rowid, name, description)
+            VALUES (new.item_id, new.name, new.description);
+        END
+    ''',
+    '''
+        CREATE TRIGGER IF NOT EXISTS menu_items_fts_delete
+        AFTER DELETE ON menu_items BEGIN
+            INSERT INTO menu_items_fts (menu_items_fts, rowid, name, description)
+            VALUES ('delete', old.item_id, old.name, old.description);
+        END
+    ''',
+    '''
+        CREATE TRIGGER IF NOT EXISTS menu_items_fts_update
+        AFTER UPDATE OF name, description ON menu_items BEGIN
+            INSERT INTO menu_items_fts (menu_items_fts, rowid, name, description)
+            VALUES ('delete', old.item_id, old.name, old.description);
+            INSERT INTO menu_items_fts (rowid, name, description)
+            VALUES (new.item_id, new.name, new.description);
+        END
+    ''',
+)
+
+SQL_REBUILD_FTS = "INSERT INTO menu_items_fts (menu_items_fts) VALUES ('rebuild')"
+
+# Whether the admin user and any categories exist, in one query
+SQL_DEFAULT_DATA_COUNTS = '''
+    SELECT (SELECT COUNT(*) FROM users WHERE username = 'admin'),
+           (SELECT COUNT(*) FROM categories)
+'''
+
+SQL_INSERT_USER = '''
+    INSERT INTO users (username, password_hash, password_salt, role, full_name, email)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERT_CATEGORY = '''
+    INSERT INTO categories (name, description)
+    VALUES (?, ?)
+'''
 
 class DatabaseManager:
     """Manages all database operations for the Restaurant Menu System"""
@@ -20,132 +172,219 @@ class DatabaseManager:
         
         print(f"📁 Database will be stored at: {self.db_path}")
         
+        # Each thread keeps one open connection for its whole life, so
+        # queries reuse its page cache and prepared statements instead
+        # of reopening the file each time
+        self._tls = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        # Bumped by close(); a thread whose connection is from an older
+        # generation opens a new one instead of using the closed one
+        self._generation = 0
+        atexit.register(self.close)
+        
         # Initialize the database
         self.init_database()
     
-    def get_connection(self):
-        """Create and return a database connection"""
-        return sqlite3.connect(self.db_path)
+    def get_connection(self) -> sqlite3.Connection:
+        """Return this thread's database connection, opening it on first use"""
+        conn = getattr(self._tls, "conn", None)
+        if conn is None or self._tls.generation != self._generation:
+            # Closed from whichever thread runs close() at shutdown.
+            # isolation_level=None: no implicit BEGIN before each write;
+            # transactions are opened explicitly by transaction()
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=256, isolation_level=None)
+            self._apply_pragmas(conn)
+            # Rows still index like tuples but can also be read by column name
+            conn.row_factory = sqlite3.Row
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._tls.generation = self._generation
+            self._tls.conn = conn
+            # Kept if the connection was replaced inside an acquire() block
+            self._tls.depth = getattr(self._tls, "depth", 0)
+        return conn
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """Tune a freshly opened connection"""
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+    
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Use this thread's connection for the duration of a with-block"""
+        conn = self.get_connection()
+        self._tls.depth += 1
+        try:
+            yield conn
+        finally:
+            self._tls.depth -= 1
+            # Never leave a half-finished transaction behind for the next
+            # caller (nested blocks leave that to the outermost one)
+            if self._tls.depth == 0 and conn.in_transaction:
+                conn.rollback()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group writes into one transaction: commit if the block succeeds,
+        roll back if it raises. Inside another transaction() block this
+        just joins the outer transaction.
+        """
+        with self.acquire() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            
+            # IMMEDIATE takes the write lock up front instead of failing
+            # halfway through if another connection is writing
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        """
+        Run a single write statement
+        Outside a transaction() block it commits on its own; inside one it
+        becomes part of that transaction
+        Returns the cursor so callers can check rowcount/lastrowid
+        """
+        with self.acquire() as conn:
+            return conn.execute(sql, params)
+    
+    def close(self):
+        """
+        Close every thread's connection (also run at interpreter exit)
+        A thread that uses the manager afterwards opens a new one
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
     
     def init_database(self):
         """Create all necessary tables"""
         print("🗄️  Initializing database tables...")
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        # One transaction for the whole schema setup
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Create Users table for authentication
+            cursor.execute(SQL_CREATE_USERS)
+            
+            # Databases created before salted hashing don't have the salt column;
+            # their users keep a NULL salt until they next log in
+            cursor.execute(SQL_USERS_COLUMNS)
+            if "password_salt" not in {column[1] for column in cursor.fetchall()}:
+                cursor.execute(SQL_ADD_PASSWORD_SALT)
+            
+            # Create Categories and Menu Items tables
+            cursor.execute(SQL_CREATE_CATEGORIES)
+            cursor.execute(SQL_CREATE_MENU_ITEMS)
+            
+            for sql in SQL_CREATE_INDEXES:
+                cursor.execute(sql)
+            
+            # Full-text index used by menu search
+            self.fts_enabled = self.create_search_index(cursor)
         
-        # Create Users table for authentication
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT DEFAULT 'staff',
-                full_name TEXT,
-                email TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        print("✅ Database tables created successfully!")
         
-        # Create Categories table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS categories (
-                category_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                description TEXT,
-                is_active BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        # Create default data
+        self.create_default_data()
+    
+    def create_search_index(self, cursor) -> bool:
+        """
+        Create the FTS5 table over menu item names/descriptions and the
+        triggers that keep it in sync with menu_items
+        Returns False if this SQLite build has no FTS5 support
+        """
+        cursor.execute(SQL_FTS_EXISTS)
+        is_new = cursor.fetchone()[0] == 0
         
-        # Create Menu Items table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS menu_items (
-                item_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                price DECIMAL(10,2) NOT NULL,
-                category_id INTEGER,
-                is_available BOOLEAN DEFAULT 1,
-                preparation_time INTEGER DEFAULT 15,
-                ingredients TEXT,
-                allergens TEXT,
-                calories INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories (category_id)
-            )
-        ''')
+        try:
+            cursor.execute(SQL_CREATE_FTS)
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Full-text search unavailable ({e}), using plain search")
+            return False
         
-        conn.commit()
-        conn.close()
+        for sql in SQL_CREATE_FTS_TRIGGERS:
+            cursor.execute(sql)
         
-        print("✅ Database tables created successfully!")
+        # Index any items that existed before the search table did
+        if is_new:
+            cursor.execute(SQL_REBUILD_FTS)
         
-        # Create default data
-        self.create_default_data()
+        return True
     
     def create_default_data(self):
         """Create default admin user and sample categories"""
         print("👤 Creating default users and sample data...")
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Check if admin user already exists
-        cursor.execute("SELECT COUNT(*) FROM users WHERE username = 'admin'")
-        if cursor.fetchone()[0] == 0:
-            # Create admin user
-            admin_password = self.hash_password("admin123")
-            cursor.execute('''
-                INSERT INTO users (username, password_hash, role, full_name, email)
-                VALUES (?, ?, ?, ?, ?)
-            ''', ("admin", admin_password, "admin", "System Administrator", "admin@restaurant.com"))
-            
-            # Create staff user
-            staff_password = self.hash_password("staff123")
-            cursor.execute('''
-                INSERT INTO users (username, password_hash, role, full_name, email)
-                VALUES (?, ?, ?, ?, ?)
-            ''', ("staff", staff_password, "staff", "Restaurant Staff", "staff@restaurant.com"))
+        # One write transaction for the checks and all the inserts
+        with self.transaction() as conn:
+            cursor = conn.cursor()
             
-            print("✅ Default users created:")
-            print("   👑 Admin - Username: 'admin', Password: 'admin123'")
-            print("   👨‍🍳 Staff - Username: 'staff', Password: 'staff123'")
-        
-        # Check if categories exist
-        cursor.execute("SELECT COUNT(*) FROM categories")
-        if cursor.fetchone()[0] == 0:
-            # Create sample categories
-            categories = [
-                ("Appetizers", "Start your meal with our delicious appetizers"),
-                ("Main Courses", "Our signature main dishes"),
-                ("Desserts", "Sweet treats to end your meal"),
-                ("Beverages", "Refreshing drinks and beverages"),
-                ("Salads", "Fresh and healthy salad options")
-            ]
+            # Check if the admin user and any categories already exist
+            cursor.execute(SQL_DEFAULT_DATA_COUNTS)
+            admin_count, category_count = cursor.fetchone()
             
-            cursor.executemany('''
-                INSERT INTO categories (name, description)
-                VALUES (?, ?)
-            ''', categories)
+            if admin_count == 0:
+                # Create admin and staff users
+                admin_salt, admin_password = self.hash_password("admin123")
+                staff_salt, staff_password = self.hash_password("staff123")
+                cursor.executemany(SQL_INSERT_USER, [
+                    ("admin", admin_password, admin_salt, "admin", "System Administrator", "admin@restaurant.com"),
+                    ("staff", staff_password, staff_salt, "staff", "Restaurant Staff", "staff@restaurant.com"),
+                ])
+                
+                print("✅ Default users created:")
+                print("   👑 Admin - Username: 'admin', Password: 'admin123'")
+                print("   👨‍🍳 Staff - Username: 'staff', Password: 'staff123'")
             
-            print("✅ Sample categories created!")
-        
-        conn.commit()
-        conn.close()
+            if category_count == 0:
+                # Create sample categories
+                categories = [
+                    ("Appetizers", "Start your meal with our delicious appetizers"),
+                    ("Main Courses", "Our signature main dishes"),
+                    ("Desserts", "Sweet treats to end your meal"),
+                    ("Beverages", "Refreshing drinks and beverages"),
+                    ("Salads", "Fresh and healthy salad options")
+                ]
+                
+                cursor.executemany(SQL_INSERT_CATEGORY, categories)
+                
+                print("✅ Sample categories created!")
     
-    def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256 for security"""
+    def hash_password(self, password: str, salt_hex: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Hash password using PBKDF2-HMAC-SHA256 with a per-user salt
+        A fresh random salt is generated unless the stored one is passed in
+        Returns (salt_hex, hash_hex)
+        """
+        if salt_hex is None:
+            salt_hex = os.urandom(16).hex()
+        password_hash = hashlib.pbkdf2_hmac("sha256", password.encode(),
+                                            bytes.fromhex(salt_hex),
+                                            PASSWORD_HASH_ITERATIONS)
+        return salt_hex, password_hash.hex()
+    
+    def legacy_hash_password(self, password: str) -> str:
+        """Unsalted SHA-256 hash, only used to check accounts from before PBKDF2"""
         return hashlib.sha256(password.encode()).hexdigest()
     
     def test_connection(self):
         """Test database connection"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            conn.close()
+            with self.acquire() as conn:
+                conn.execute("SELECT 1")
             print("✅ Database connection test successful!")
             return True
         except Exception as e:
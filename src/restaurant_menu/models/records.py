@@ -0,0 +1,34 @@
+"""
+Record types for the Restaurant Menu System
+The managers return rows as these named tuples, so fields can be read by
+name (item.price, user.role) while positional indexing still works
+"""
+
+from typing import NamedTuple, Optional
+
+class MenuItem(NamedTuple):
+    """A menu item, with its category name filled in"""
+    item_id: int
+    name: str
+    description: Optional[str]
+    price: float
+    category: Optional[str]
+    is_available: bool
+    preparation_time: Optional[int]
+    ingredients: Optional[str]
+    allergens: Optional[str]
+    calories: Optional[int]
+
+class User(NamedTuple):
+    """A user's account details (never the password hash)"""
+    user_id: int
+    username: str
+    role: str
+    full_name: Optional[str]
+    email: Optional[str]
+    created_at: Optional[str] = None
+    
+    @property
+    def display_name(self) -> str:
+        """Full name if set, otherwise the username"""
+        return self.full_name or self.username
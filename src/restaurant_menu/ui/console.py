@@ -0,0 +1,88 @@
+"""
+Console output helpers for the Restaurant Menu System
+Lets screens that never change be encoded once and written as raw bytes
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+# Erase the screen and move the cursor to the top-left corner
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# SetConsoleMode flag that makes the Windows console interpret ANSI escapes
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+@lru_cache(maxsize=None)
+def enable_ansi() -> bool:
+    """
+    Check once whether stdout is a terminal that understands ANSI escapes
+    On Windows 10+ this also switches on the console's VT processing
+    The answer is cached and shared by every screen
+    """
+    if not sys.stdout.isatty() or os.environ.get("TERM") == "dumb":
+        return False
+    
+    if os.name != 'nt':
+        return True
+    
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (AttributeError, OSError):
+        return False
+
+@lru_cache(maxsize=None)
+def stdin_is_interactive() -> bool:
+    """Check once whether stdin is a terminal rather than piped/scripted input"""
+    return sys.stdin.isatty()
+
+def clear_screen():
+    """
+    Clear the terminal with an escape sequence when it supports them
+    (see enable_ansi); other terminals fall back to cls/clear, and
+    output that isn't a terminal is left alone
+    """
+    if enable_ansi():
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+    elif sys.stdout.isatty():
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+def read_line(prompt: str) -> str:
+    """
+    Show a prompt and read one line of input, like input()
+    Non-interactive (piped/scripted) stdin is read with readline directly
+    """
+    if stdin_is_interactive():
+        return input(prompt)
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def write_bytes(data: bytes):
+    """
+    Write UTF-8 encoded text to stdout
+    Falls back to a normal text write when stdout has no byte buffer
+    (e.g. it was replaced by a StringIO) or doesn't use UTF-8
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    encoding = (getattr(stream, "encoding", None) or "").lower().replace("-", "")
+    
+    if buffer is None or encoding != "utf8":
+        stream.write(data.decode("utf-8"))
+        return
+    
+    # Push out anything print() left in the text layer so output stays in order
+    stream.flush()
+    buffer.write(data)
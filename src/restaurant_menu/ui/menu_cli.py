@@ -3,8 +3,112 @@ Menu CLI Interface for Restaurant Menu System
 Provides user-friendly command-line interface for menu management
 """
 
-import os
-from typing import List, Tuple, Optional, Dict
+import math
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, List, Sized, Tuple, Optional, Dict
+
+from ..models.records import MenuItem
+from .console import read_line, write_bytes
+
+# Table row templates, built once and reused for every row; the
+# precision on text fields (.29, .14, ...) truncates them to fit
+ITEM_ROW_TEMPLATE = "{:<4} {:<30.29} {:<15.14} ${:<7.2f} {:<10}"
+ITEM_DETAIL_ROW_TEMPLATE = "{:<4} {:<25.24} {:<15.14} ${:<7.2f} {:<6} {:<10}"
+CATEGORY_ROW_TEMPLATE = "{:<4} {:<20} {:<10} {:<25.24}"
+
+ITEM_HEADING = f"{'ID':<4} {'Name':<30} {'Category':<15} {'Price':<8} {'Available':<10}"
+ITEM_DETAIL_HEADING = f"{'ID':<4} {'Name':<25} {'Category':<15} {'Price':<8} {'Prep':<6} {'Available':<10}"
+CATEGORY_HEADING = CATEGORY_ROW_TEMPLATE.format('ID', 'Name', 'Status', 'Description')
+
+# Separators and headers, built once instead of on every render
+CATEGORY_RULE = "-" * 60
+ITEM_RULE = "=" * 100
+CATEGORY_TABLE_HEADER = ["\n📂 AVAILABLE CATEGORIES:", CATEGORY_RULE, CATEGORY_HEADING, CATEGORY_RULE]
+HEADER_TEMPLATE = "\n".join(["\n" + "=" * 60, "        🍽️  {}  🍽️", "=" * 60])
+MENU_HEADER_TEMPLATE = "\n--- {} ---"
+
+# Lines written per stdout write when displaying a menu table
+DISPLAY_BATCH_SIZE = 200
+
+# Written when a menu items table would be empty, encoded to UTF-8 once
+NO_ITEMS_BYTES = "📭 No menu items found.\n".encode("utf-8")
+
+# The whole statistics block, filled from get_menu_statistics() in one call
+STATS_TEMPLATE = "\n".join([
+    "📋 Total Menu Items: {total_items}",
+    "✅ Available Items: {available_items}",
+    "❌ Unavailable Items: {unavailable_items}",
+    "📂 Total Categories: {total_categories}",
+    "💰 Average Price: ${average_price:.2f}",
+])
+
+# Fixed text prompts for the add-item and search screens
+ITEM_NAME_PROMPT = "Item Name: "
+DESCRIPTION_PROMPT = "Description: "
+INGREDIENTS_PROMPT = "Ingredients (optional): "
+ALLERGENS_PROMPT = "Allergens (optional): "
+SEARCH_PROMPT = "Enter search term (name or description): "
+
+INVALID_NUMBER_ERROR = "❌ Please enter a valid number"
+
+# Lowest values accepted for a new menu item, by the Add New Menu Item
+# form and by Bulk Add Items from CSV alike
+MIN_PRICE = 0.01
+MIN_PREPARATION_TIME = 1
+MIN_CALORIES = 0
+
+# Answers accepted by ask_yes_no, and its error message
+YES_NO_CHOICES = ('y', 'yes', 'n', 'no')
+YES_NO_SET = frozenset(YES_NO_CHOICES)
+YES_NO_ERROR = f"❌ Invalid choice. Please choose from: {', '.join(YES_NO_CHOICES)}"
+
+def number_in_range(num: float, low: float = -math.inf, high: float = math.inf) -> bool:
+    """True for a finite number from low to high (NaN, inf and 1e999 never are)"""
+    return math.isfinite(num) and low <= num <= high
+
+def _norm(text: str) -> str:
+    """Strip and lowercase an answer"""
+    return text.strip().lower()
+
+def _item_table_header(count: int, show_details: bool, total: Optional[int] = None,
+                       offset: int = 0) -> List[str]:
+    """
+    Title, heading and rules above a menu items table
+    When the table is one page of a longer list, total is the length of
+    the whole list and offset the position of the page's first item
+    """
+    if total is not None and count < total:
+        title = f"\n🍽️  MENU ITEMS (items {offset + 1}-{offset + count} of {total}):"
+    else:
+        title = f"\n🍽️  MENU ITEMS ({count} items):"
+    heading = ITEM_DETAIL_HEADING if show_details else ITEM_HEADING
+    return [title, ITEM_RULE, heading, ITEM_RULE]
+
+def _item_rows(items: Iterable[MenuItem], show_details: bool) -> Iterator[str]:
+    """Yield the table lines for each item as it is reached"""
+    row = (ITEM_DETAIL_ROW_TEMPLATE if show_details else ITEM_ROW_TEMPLATE).format
+    
+    for item in items:
+        availability = "✅ Yes" if item.is_available else "❌ No"
+        category = item.category or "No Category"
+        
+        if show_details:
+            prep_time = f"{item.preparation_time}min" if item.preparation_time else "N/A"
+            yield row(item.item_id, item.name, category, item.price,
+                      prep_time, availability)
+            
+            # Show description if available
+            if item.description:
+                yield f"     📝 {item.description}"
+            
+            # Show allergens if any
+            if item.allergens:
+                yield f"     ⚠️  Allergens: {item.allergens}"
+            
+            yield ""  # Empty line between items
+        else:
+            yield row(item.item_id, item.name, category, item.price, availability)
 
 class MenuCLI:
     """Command Line Interface for Menu Management"""
@@ -14,55 +118,68 @@ class MenuCLI:
         self.menu_manager = menu_manager
         self.user_manager = user_manager
         self.current_user = None
-    
-    def clear_screen(self):
-        """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        
+        # (menu version, items, items by ID) for the update/delete screens
+        self._items_cache = None
     
     def show_header(self, title: str):
         """Show a formatted header"""
-        print("\n" + "=" * 60)
-        print(f"        🍽️  {title.upper()}  🍽️")
-        print("=" * 60)
+        print(HEADER_TEMPLATE.format(title.upper()))
     
     def show_menu_header(self, subtitle: str):
         """Show menu section header"""
-        print(f"\n--- {subtitle} ---")
+        print(MENU_HEADER_TEMPLATE.format(subtitle))
     
     def pause(self, message: str = "Press Enter to continue..."):
         """Pause and wait for user input"""
-        input(f"\n{message}")
+        read_line(f"\n{message}")
     
     def get_user_choice(self, prompt: str, valid_choices: List[str]) -> str:
         """Get user choice with validation"""
+        error = f"❌ Invalid choice. Please choose from: {', '.join(valid_choices)}"
+        return self._read_choice(prompt, frozenset(valid_choices), error)
+    
+    def ask_yes_no(self, prompt: str) -> bool:
+        """Ask a y/n question; True for yes"""
+        # Only 'y' and 'yes' get past the check and start with 'y'
+        return self._read_choice(prompt, YES_NO_SET, YES_NO_ERROR)[:1] == 'y'
+    
+    def _read_choice(self, prompt: str, valid_set: frozenset, error: str) -> str:
+        """Prompt until the answer is in valid_set"""
+        prompt = f"{prompt}: "
         while True:
-            choice = input(f"{prompt}: ").strip().lower()
-            if choice in valid_choices:
+            choice = _norm(read_line(prompt))
+            if choice in valid_set:
                 return choice
-            print(f"❌ Invalid choice. Please choose from: {', '.join(valid_choices)}")
+            print(error)
     
     def get_number_input(self, prompt: str, min_val: float = None, max_val: float = None) -> Optional[float]:
         """Get number input with validation"""
+        prompt = f"{prompt}: "
+        
+        # Open bounds become infinities so the range check is one comparison
+        low = float("-inf") if min_val is None else min_val
+        high = float("inf") if max_val is None else max_val
+        too_low = f"❌ Value must be at least {min_val}"
+        too_high = f"❌ Value must be at most {max_val}"
+        
         while True:
+            value = read_line(prompt).strip()
+            if not value:
+                return None
+            
             try:
-                value = input(f"{prompt}: ").strip()
-                if not value:
-                    return None
-                
                 num = float(value)
-                
-                if min_val is not None and num < min_val:
-                    print(f"❌ Value must be at least {min_val}")
-                    continue
-                
-                if max_val is not None and num > max_val:
-                    print(f"❌ Value must be at most {max_val}")
-                    continue
-                
-                return num
-                
             except ValueError:
-                print("❌ Please enter a valid number")
+                num = None
+            
+            if num is not None and number_in_range(num, low, high):
+                return num
+            
+            if num is None or not math.isfinite(num):
+                print(INVALID_NUMBER_ERROR)
+            else:
+                print(too_low if num < low else too_high)
     
     def display_categories(self, categories: List[Tuple]):
         """Display categories in a formatted table"""
@@ -70,53 +187,84 @@ class MenuCLI:
             print("📭 No categories found.")
             return
         
-        print("\n📂 AVAILABLE CATEGORIES:")
-        print("-" * 60)
-        print(f"{'ID':<4} {'Name':<20} {'Status':<10} {'Description':<25}")
-        print("-" * 60)
+        out = CATEGORY_TABLE_HEADER.copy()
+        append = out.append
+        row = CATEGORY_ROW_TEMPLATE.format
         
         for cat in categories:
             status = "✅ Active" if cat[3] else "❌ Inactive"
-            description = (cat[2] or "No description")[:24]
-            print(f"{cat[0]:<4} {cat[1]:<20} {status:<10} {description:<25}")
+            append(row(cat[0], cat[1], status, cat[2] or "No description"))
+        
+        # One write for the whole table instead of a print per row
+        out.append("")
+        sys.stdout.write("\n".join(out))
     
-    def display_menu_items(self, items: List[Tuple], show_details: bool = False):
-        """Display menu items in a formatted table"""
-        if not items:
-            print("📭 No menu items found.")
-            return
+    def display_menu_items(self, items: Iterable[MenuItem], show_details: bool = False) -> bool:
+        """
+        Display menu items in a formatted table
+        items can be any iterable (e.g. MenuManager.iter_all_menu_items())
+        Rows are formatted and written DISPLAY_BATCH_SIZE lines at a time
+        Returns False if there was nothing to show
+        """
+        if not isinstance(items, Sized):
+            items = list(items)
         
-        print(f"\n🍽️  MENU ITEMS ({len(items)} items):")
-        print("=" * 100)
+        if not items:
+            write_bytes(NO_ITEMS_BYTES)
+            return False
         
-        if show_details:
-            print(f"{'ID':<4} {'Name':<25} {'Category':<15} {'Price':<8} {'Prep':<6} {'Available':<10}")
-        else:
-            print(f"{'ID':<4} {'Name':<30} {'Category':<15} {'Price':<8} {'Available':<10}")
+        # The same header lines format_menu_items uses, encoded here
+        prelude = ("\n".join(_item_table_header(len(items), show_details)) + "\n").encode("utf-8")
         
-        print("=" * 100)
+        # Each batch is encoded with one call and written straight to the
+        # byte buffer; the title and headings go out with the first batch,
+        # so a table of up to DISPLAY_BATCH_SIZE lines is a single write
+        rows = _item_rows(items, show_details)
+        while True:
+            batch = list(islice(rows, DISPLAY_BATCH_SIZE))
+            if not batch:
+                break
+            write_bytes(prelude + ("\n".join(batch) + "\n").encode("utf-8"))
+            prelude = b""
         
-        for item in items:
-            availability = "✅ Yes" if item[5] else "❌ No"
-            category = (item[4] or "No Category")[:14]
-            
-            if show_details:
-                prep_time = f"{item[6]}min" if item[6] else "N/A"
-                print(f"{item[0]:<4} {item[1][:24]:<25} {category:<15} "
-                      f"${item[3]:<7.2f} {prep_time:<6} {availability:<10}")
-                
-                # Show description if available
-                if item[2]:
-                    print(f"     📝 {item[2]}")
-                
-                # Show allergens if any
-                if item[8]:
-                    print(f"     ⚠️  Allergens: {item[8]}")
-                
-                print()  # Empty line between items
-            else:
-                print(f"{item[0]:<4} {item[1][:29]:<30} {category:<15} "
-                      f"${item[3]:<7.2f} {availability:<10}")
+        return True
+    
+    def format_menu_items(self, items: Iterable[MenuItem], show_details: bool = False,
+                          total: Optional[int] = None, offset: int = 0) -> List[str]:
+        """
+        Build the lines of the menu items table, ready to print
+        For one page of a longer list, pass the list's total length and the
+        page's offset so the title shows which items these are
+        Goes through items once; returns an empty list if there are none
+        """
+        count = 0
+        
+        def counted() -> Iterator[MenuItem]:
+            # Tally the items as _item_rows reaches them, so an iterator
+            # isn't copied into a list just to learn its length
+            nonlocal count
+            for item in items:
+                count += 1
+                yield item
+        
+        rows = list(_item_rows(counted(), show_details))
+        if not count:
+            return []
+        
+        return _item_table_header(count, show_details, total, offset) + rows
+    
+    def _get_items(self) -> Tuple[List[MenuItem], Dict[int, MenuItem]]:
+        """
+        All menu items and an ID lookup for them, re-read only when the
+        menu version has changed since they were last fetched
+        """
+        version = self.menu_manager.get_menu_version()
+        
+        if self._items_cache is None or self._items_cache[0] != version:
+            items = self.menu_manager.get_all_menu_items()
+            self._items_cache = (version, items, {item.item_id: item for item in items})
+        
+        return self._items_cache[1], self._items_cache[2]
     
     def get_menu_item_input(self) -> Optional[Dict]:
         """Get menu item information from user"""
@@ -133,14 +281,14 @@ class MenuCLI:
         try:
             print("\nEnter menu item details:")
             
-            name = input("Item Name: ").strip()
+            name = read_line(ITEM_NAME_PROMPT).strip()
             if not name:
                 print("❌ Item name is required.")
                 return None
             
-            description = input("Description: ").strip()
+            description = read_line(DESCRIPTION_PROMPT).strip()
             
-            price = self.get_number_input("Price ($)", min_val=0.01)
+            price = self.get_number_input("Price ($)", min_val=MIN_PRICE)
             if price is None:
                 print("❌ Price is required.")
                 return None
@@ -153,22 +301,23 @@ class MenuCLI:
             
             category_id = int(category_id)
             
-            # Verify category exists
-            if not any(cat[0] == category_id for cat in categories):
+            # Verify category exists (a dict lookup in the manager's category cache)
+            if self.menu_manager.get_category_by_id(category_id) is None:
                 print(f"❌ Category ID {category_id} does not exist.")
                 return None
             
             # Optional fields
-            prep_time = self.get_number_input("Preparation time (minutes, default 15)", min_val=1)
+            prep_time = self.get_number_input("Preparation time (minutes, default 15)",
+                                              min_val=MIN_PREPARATION_TIME)
             if prep_time is None:
                 prep_time = 15
             else:
                 prep_time = int(prep_time)
             
-            ingredients = input("Ingredients (optional): ").strip()
-            allergens = input("Allergens (optional): ").strip()
+            ingredients = read_line(INGREDIENTS_PROMPT).strip()
+            allergens = read_line(ALLERGENS_PROMPT).strip()
             
-            calories = self.get_number_input("Calories (optional)", min_val=0)
+            calories = self.get_number_input("Calories (optional)", min_val=MIN_CALORIES)
             if calories is not None:
                 calories = int(calories)
             else:
@@ -189,26 +338,29 @@ class MenuCLI:
             print("\n❌ Input cancelled.")
             return None
     
-    def show_item_details(self, item: Tuple):
+    def show_item_details(self, item: MenuItem):
         """Show detailed information about a menu item"""
-        print(f"\n--- 📋 ITEM DETAILS ---")
-        print(f"ID: {item[0]}")
-        print(f"Name: {item[1]}")
-        print(f"Description: {item[2] or 'No description'}")
-        print(f"Price: ${item[3]:.2f}")
-        print(f"Category: {item[4] or 'No category'}")
-        print(f"Available: {'✅ Yes' if item[5] else '❌ No'}")
-        print(f"Preparation Time: {item[6]} minutes")
-        print(f"Ingredients: {item[7] or 'Not specified'}")
-        print(f"Allergens: {item[8] or 'None'}")
-        print(f"Calories: {item[9] or 'Not specified'}")
+        sys.stdout.write("\n".join([
+            "\n--- 📋 ITEM DETAILS ---",
+            f"ID: {item.item_id}",
+            f"Name: {item.name}",
+            f"Description: {item.description or 'No description'}",
+            f"Price: ${item.price:.2f}",
+            f"Category: {item.category or 'No category'}",
+            f"Available: {'✅ Yes' if item.is_available else '❌ No'}",
+            f"Preparation Time: {item.preparation_time} minutes",
+            f"Ingredients: {item.ingredients or 'Not specified'}",
+            f"Allergens: {item.allergens or 'None'}",
+            f"Calories: {item.calories or 'Not specified'}",
+            "",
+        ]))
     
     def search_menu_interface(self):
         """Interactive menu search interface"""
         while True:
             self.show_menu_header("🔍 SEARCH MENU ITEMS")
             
-            search_term = input("Enter search term (name or description): ").strip()
+            search_term = read_line(SEARCH_PROMPT).strip()
             if not search_term:
                 print("❌ Please enter a search term.")
                 continue
@@ -222,11 +374,9 @@ class MenuCLI:
                 self.display_menu_items(results)
                 
                 # Option to view details
-                view_details = self.get_user_choice(
-                    "View item details? (y/n)", ['y', 'yes', 'n', 'no']
-                )
+                view_details = self.ask_yes_no("View item details? (y/n)")
                 
-                if view_details in ['y', 'yes']:
+                if view_details:
                     item_id = self.get_number_input("Enter Item ID", min_val=1)
                     if item_id:
                         item = self.menu_manager.get_item_by_id(int(item_id))
@@ -236,11 +386,9 @@ class MenuCLI:
                             print(f"❌ Item with ID {int(item_id)} not found.")
             
             # Continue searching?
-            continue_search = self.get_user_choice(
-                "Search again? (y/n)", ['y', 'yes', 'n', 'no']
-            )
+            continue_search = self.ask_yes_no("Search again? (y/n)")
             
-            if continue_search in ['n', 'no']:
+            if not continue_search:
                 break
     
     def update_menu_item_interface(self):
@@ -248,13 +396,10 @@ class MenuCLI:
         self.show_menu_header("✏️ UPDATE MENU ITEM")
         
         # Show all items first
-        items = self.menu_manager.get_all_menu_items()
-        if not items:
-            print("📭 No menu items found.")
+        items, items_by_id = self._get_items()
+        if not self.display_menu_items(items):
             return
         
-        self.display_menu_items(items)
-        
         item_id = self.get_number_input("Enter Item ID to update", min_val=1)
         if not item_id:
             return
@@ -262,12 +407,12 @@ class MenuCLI:
         item_id = int(item_id)
         
         # Get current item details
-        current_item = self.menu_manager.get_item_by_id(item_id)
+        current_item = items_by_id.get(item_id)
         if not current_item:
             print(f"❌ Item with ID {item_id} not found.")
             return
         
-        print(f"\nCurrent details for: {current_item[1]}")
+        print(f"\nCurrent details for: {current_item.name}")
         self.show_item_details(current_item)
         
         print("\nEnter new values (press Enter to keep current value):")
@@ -275,30 +420,27 @@ class MenuCLI:
         updates = {}
         
         # Get new values
-        new_name = input(f"Name [{current_item[1]}]: ").strip()
+        new_name = read_line(f"Name [{current_item.name}]: ").strip()
         if new_name:
             updates['name'] = new_name
         
-        new_desc = input(f"Description [{current_item[2] or 'None'}]: ").strip()
+        new_desc = read_line(f"Description [{current_item.description or 'None'}]: ").strip()
         if new_desc:
             updates['description'] = new_desc
         
-        new_price = self.get_number_input(f"Price [${current_item[3]:.2f}]", min_val=0.01)
+        new_price = self.get_number_input(f"Price [${current_item.price:.2f}]", min_val=0.01)
         if new_price:
             updates['price'] = new_price
         
-        new_prep = self.get_number_input(f"Prep time [{current_item[6]} min]", min_val=1)
+        new_prep = self.get_number_input(f"Prep time [{current_item.preparation_time} min]", min_val=1)
         if new_prep:
             updates['preparation_time'] = int(new_prep)
         
         # Availability toggle
-        current_availability = "Available" if current_item[5] else "Not Available"
-        toggle = self.get_user_choice(
-            f"Availability [{current_availability}] - Toggle? (y/n)", 
-            ['y', 'yes', 'n', 'no']
-        )
-        if toggle in ['y', 'yes']:
-            updates['is_available'] = not current_item[5]
+        current_availability = "Available" if current_item.is_available else "Not Available"
+        toggle = self.ask_yes_no(f"Availability [{current_availability}] - Toggle? (y/n)")
+        if toggle:
+            updates['is_available'] = not current_item.is_available
         
         if not updates:
             print("❌ No changes made.")
@@ -309,9 +451,10 @@ class MenuCLI:
         for key, value in updates.items():
             print(f"  - {key.replace('_', ' ').title()}: {value}")
         
-        confirm = self.get_user_choice("Confirm updates? (y/n)", ['y', 'yes', 'n', 'no'])
-        if confirm in ['y', 'yes']:
+        confirm = self.ask_yes_no("Confirm updates? (y/n)")
+        if confirm:
             if self.menu_manager.update_menu_item(item_id, **updates):
+                self._items_cache = None
                 print("✅ Menu item updated successfully!")
             else:
                 print("❌ Failed to update menu item.")
@@ -323,13 +466,10 @@ class MenuCLI:
         self.show_menu_header("🗑️ DELETE MENU ITEM")
         
         # Show all items
-        items = self.menu_manager.get_all_menu_items()
-        if not items:
-            print("📭 No menu items found.")
+        items, items_by_id = self._get_items()
+        if not self.display_menu_items(items):
             return
         
-        self.display_menu_items(items)
-        
         item_id = self.get_number_input("Enter Item ID to delete", min_val=1)
         if not item_id:
             return
@@ -337,22 +477,20 @@ class MenuCLI:
         item_id = int(item_id)
         
         # Get item details for confirmation
-        item = self.menu_manager.get_item_by_id(item_id)
+        item = items_by_id.get(item_id)
         if not item:
             print(f"❌ Item with ID {item_id} not found.")
             return
         
         print(f"\nItem to be deleted:")
-        print(f"  - {item[1]} (${item[3]:.2f})")
-        print(f"  - {item[2] or 'No description'}")
+        print(f"  - {item.name} (${item.price:.2f})")
+        print(f"  - {item.description or 'No description'}")
         
-        confirm = self.get_user_choice(
-            "⚠️  Are you sure you want to delete this item? (y/n)", 
-            ['y', 'yes', 'n', 'no']
-        )
+        confirm = self.ask_yes_no("⚠️  Are you sure you want to delete this item? (y/n)")
         
-        if confirm in ['y', 'yes']:
+        if confirm:
             if self.menu_manager.delete_menu_item(item_id):
+                self._items_cache = None
                 print("✅ Menu item deleted successfully!")
             else:
                 print("❌ Failed to delete menu item.")
@@ -365,24 +503,16 @@ class MenuCLI:
         
         stats = self.menu_manager.get_menu_statistics()
         
-        print(f"📋 Total Menu Items: {stats['total_items']}")
-        print(f"✅ Available Items: {stats['available_items']}")
-        print(f"❌ Unavailable Items: {stats['unavailable_items']}")
-        print(f"📂 Total Categories: {stats['total_categories']}")
-        print(f"💰 Average Price: ${stats['average_price']:.2f}")
+        print(STATS_TEMPLATE.format_map(stats))
 
-# Test the menu CLI when this file is run directly
+# Test the menu CLI when this module is run directly, from the
+# project root: python -m src.restaurant_menu.ui.menu_cli
 if __name__ == "__main__":
     print("Testing Menu CLI...")
     
-    # Import required modules
-    import sys
-    from pathlib import Path
-    sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-    
-    from src.restaurant_menu.models.database import DatabaseManager
-    from src.restaurant_menu.managers.menu_manager import MenuManager
-    from src.restaurant_menu.managers.user_manager import UserManager
+    from ..models.database import DatabaseManager
+    from ..managers.menu_manager import MenuManager
+    from ..managers.user_manager import UserManager
     
     # Create instances
     db = DatabaseManager()
@@ -396,8 +526,7 @@ if __name__ == "__main__":
     menu_cli.display_categories(categories)
     
     print("\n🧪 Testing menu items display...")
-    items = menu_manager.get_all_menu_items()
-    menu_cli.display_menu_items(items, show_details=True)
+    menu_cli.display_menu_items(menu_manager.iter_all_menu_items(), show_details=True)
     
     print("\n🧪 Testing statistics display...")
     menu_cli.show_menu_statistics()